@@ -0,0 +1,51 @@
+# _components.py
+import reflex as rx
+
+from chatapp import style
+from chatapp.state import State
+
+
+def qa(question: str, answer: str) -> rx.Component:
+    return rx.box(
+        rx.box(
+            rx.text(question, text_align="right"),
+            style=style.question_style,
+        ),
+        rx.box(
+            rx.text(answer, text_align="left"),
+            style=style.answer_style,
+        ),
+        margin_y="1em",
+    )
+
+
+def chat() -> rx.Component:
+    return rx.box(
+        rx.foreach(
+            State.chat_history,
+            lambda messages: qa(messages[0], messages[1]),
+        ),
+        # Only the message being streamed re-renders on each update.
+        rx.cond(
+            State.is_streaming,
+            qa(State.current_question, State.current_answer),
+        ),
+    )
+
+
+def action_bar(
+    placeholder: str = "Has una pregunta..", button_text: str = "Aceptar"
+) -> rx.Component:
+    return rx.hstack(
+        rx.chakra.input(
+            value=State.question,
+            placeholder=placeholder,
+            on_change=State.set_question,
+            style=style.input_style,
+        ),
+        rx.button(
+            button_text,
+            on_click=State.answer,
+            style=style.button_style,
+        ),
+    )
@@ -1,26 +1,43 @@
 # state.py
-import reflex as rx
+import asyncio
+import functools
 import os
+
 import openai
+import reflex as rx
+
 
-# Comprueba si la clave de API está configurada correctamente en las variables de entorno
-if 'OPENAI_API_KEY' not in os.environ:
-    raise ValueError("La clave de API de OpenAI no está configurada en las variables de entorno")
+@functools.cache
+def get_client() -> openai.AsyncOpenAI:
+    # Share one client so its HTTP connection pool is reused across questions.
+    # The client picks up OPENAI_API_KEY from the environment.
+    return openai.AsyncOpenAI()
 
-openai.api_key = os.environ['OPENAI_API_KEY']
 
+# Push the streamed answer every FLUSH_CHARS characters or FLUSH_INTERVAL seconds.
+FLUSH_CHARS = 32
+FLUSH_INTERVAL = 0.05
 
 
 class State(rx.State):
     # The current question being asked.
     question: str
 
-    # Keep track of the chat history as a list of (question, answer) tuples.
+    # Keep track of the finished chat history as a list of (question, answer) tuples.
     chat_history: list[tuple[str, str]]
 
-    def answer(self):
+    # The question/answer pair currently being streamed.
+    current_question: str
+    current_answer: str
+    is_streaming: bool = False
+
+    async def answer(self):
+        # Comprueba si la clave de API está configurada correctamente en las variables de entorno
+        if not os.environ.get("OPENAI_API_KEY"):
+            raise RuntimeError("La clave de API de OpenAI no está configurada en las variables de entorno")
+
         # Our chatbot has some brains now!
-        session = openai.ChatCompletion.create(
+        session = await get_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "user", "content": self.question}
@@ -31,19 +48,42 @@ class State(rx.State):
         )
 
         # Add to the answer as the chatbot responds.
-        answer = ""
-        self.chat_history.append((self.question, answer))
-
-        # Clear the question input.
-        self.question = ""
-        # Yield here to clear the frontend input before continuing.
-        yield
-
-        for item in session:
-            if hasattr(item.choices[0].delta, "content"):
-                if item.choices[0].delta.content is None:
-                    # presence of 'None' indicates the end of the response
+        parts = []
+        self.current_question = self.question
+        self.current_answer = ""
+        self.is_streaming = True
+        try:
+            # Clear the question input.
+            self.question = ""
+            # Yield here to clear the frontend input before continuing.
+            yield
+
+            # Only push an update every few tokens to cut down on websocket frames.
+            loop = asyncio.get_running_loop()
+            pending = 0
+            last_flush = loop.time()
+            async for item in session:
+                if not item.choices:
+                    continue
+                choice = item.choices[0]
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                    pending += len(choice.delta.content)
+                if choice.finish_reason is not None:
+                    # a finish reason indicates the end of the response
                     break
-                answer += item.choices[0].delta.content
-                self.chat_history[-1] = (self.chat_history[-1][0], answer)
-                yield
+                if pending and (
+                    pending >= FLUSH_CHARS or loop.time() - last_flush > FLUSH_INTERVAL
+                ):
+                    self.current_answer = "".join(parts)
+                    pending = 0
+                    last_flush = loop.time()
+                    yield
+        finally:
+            # Release the connection back to the shared client's pool.
+            await session.close()
+            # Move the pair into the history, even if the stream failed partway.
+            self.chat_history.append((self.current_question, "".join(parts)))
+            self.current_question = ""
+            self.current_answer = ""
+            self.is_streaming = False
@@ -1,52 +1,13 @@
 # chatapp.py
 import reflex as rx
 
-from chatapp import style
-from chatapp.state import State
-
-def qa(question: str, answer: str) -> rx.Component:
-    return rx.box(
-        rx.box(
-            rx.text(question, text_align="right"),
-            style=style.question_style,
-        ),
-        rx.box(
-            rx.text(answer, text_align="left"),
-            style=style.answer_style,
-        ),
-        margin_y="1em",
-    )
-
-
-def chat() -> rx.Component:
-    return rx.box(
-        rx.foreach(
-            State.chat_history,
-            lambda messages: qa(messages[0], messages[1]),
-        )
-    )
-
-
-def action_bar() -> rx.Component:
-    return rx.hstack(
-        rx.chakra.input(
-            value=State.question,
-            placeholder="Ask a question",
-            on_change=State.set_question,
-            style=style.input_style,
-        ),
-        rx.button(
-            "Ask",
-            on_click=State.answer,
-            style=style.button_style,
-        ),
-    )
+from chatapp._components import action_bar, chat
 
 
 def index() -> rx.Component:
     return rx.container(
         chat(),
-        action_bar(),
+        action_bar(placeholder="Ask a question", button_text="Ask"),
     )
 
 